@@ -1,4 +1,7 @@
+import io
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
@@ -26,6 +29,21 @@ def style_plot(fig):
     )
     return fig
 
+# box plot with its points drawn as a webgl scatter instead of svg markers.
+# like points="all", the points are jittered and sit to the left of each (narrowed) box
+def webgl_box(data, x, y):
+    fig = px.box(data, x=x, y=y, points=False, color_discrete_sequence=["#00B4D8"])
+    fig.update_traces(width=0.4)
+    rng = np.random.default_rng(0)
+    xs = data[x].to_numpy(dtype=np.float64)
+    jittered = xs - 0.35 + rng.uniform(-0.1, 0.1, len(xs))
+    points = px.scatter(x=jittered, y=data[y].to_numpy(), render_mode="webgl", opacity=0.5,
+                        color_discrete_sequence=["#00B4D8"])
+    # hover shows the real x value, not the jittered position
+    points.update_traces(customdata=xs, hovertemplate=f"{x}=%{{customdata}}<br>{y}=%{{y}}<extra></extra>")
+    fig.add_traces(points.data)
+    return fig
+
 # func to styling kpis
 def display_kpi(kpi_items):
     cols = st.columns(len(kpi_items))
@@ -38,185 +56,363 @@ def display_kpi(kpi_items):
                 </div>
             """, unsafe_allow_html=True)
 
+# --- columns lists ---
+product_cols = ["MntWines", "MntFruits", "MntMeatProducts", "MntFishProducts", "MntSweetProducts", "MntGoldProds"]
+purchase_channels = ["NumWebPurchases", "NumCatalogPurchases", "NumStorePurchases"]
+cmp_cols = ['AcceptedCmp1','AcceptedCmp2','AcceptedCmp3','AcceptedCmp4','AcceptedCmp5']
+
 # --- data loading ---
-def load_data(file):
-    return pd.read_csv(file)
+# compact dtypes for the columns the tabs aggregate over
+load_dtypes = ({c: "int8" for c in cmp_cols}
+               | {c: "int32" for c in product_cols}
+               | {c: "int16" for c in purchase_channels})
+# same widths as nullable dtypes, for files with blank cells in those columns
+nullable_dtypes = {c: t.capitalize() for c, t in load_dtypes.items()}
+
+# cached so widget reruns don't re-read the file; uploads are keyed on their bytes.
+# every upload is a new key and the cache is shared across sessions, so keep only a few datasets
+DATA_CACHE_ENTRIES = 4
+
+@st.cache_data(show_spinner=False, max_entries=DATA_CACHE_ENTRIES)
+def load_data(file, fmt="csv"):
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+    if fmt == "parquet":
+        df = pd.read_parquet(file)
+        present = [c for c in load_dtypes if c in df.columns]
+        try:
+            df = df.astype({c: load_dtypes[c] for c in present})
+        except ValueError:
+            df = df.astype({c: nullable_dtypes[c] for c in present})
+    else:
+        try:
+            df = pd.read_csv(file, dtype=load_dtypes)
+        except ValueError:
+            # numpy int columns can't hold NA; re-read with the nullable dtypes
+            if hasattr(file, "seek"):
+                file.seek(0)
+            df = pd.read_csv(file, dtype=nullable_dtypes)
+    df["Income"] = pd.to_numeric(df["Income"], downcast="float")
+    return df
+
+# --- feature engineering ---
+@st.cache_data(show_spinner=False, max_entries=DATA_CACHE_ENTRIES)
+def prepare(df):
+    df = df.copy()
+    # parse the join date once and derive everything else from it
+    dt = pd.to_datetime(df["Dt_Customer"], format="%Y-%m-%d", cache=True)
+    df["_Dt"] = dt
+    df["Join_Year"] = dt.dt.year.astype("int16")
+    df["Join_Month"] = dt.dt.month.astype("int8")
+    df["_YM"] = dt.dt.to_period("M")
+    # the box plot groups/colours by marital status, so store it as a categorical of integer codes
+    df["Marital_Status"] = df["Marital_Status"].astype("category")
+    # row sums over contiguous typed blocks instead of pandas' per-column reduction
+    # missing values count as 0, as the skipna sums did
+    prod = np.ascontiguousarray(df[product_cols].to_numpy(dtype=np.int32, na_value=0))
+    df["Total_Spend"] = prod.sum(axis=1, dtype=np.int64)
+    cmp = np.ascontiguousarray(df[cmp_cols].to_numpy(dtype=np.int8, na_value=0))
+    df["Campaign_Accepted_Count"] = cmp.sum(axis=1, dtype=np.int16)
+    return df
+
+# arrow-backed string view of a column for the dataset search; one entry per searched column
+@st.cache_data(show_spinner=False, max_entries=8 * DATA_CACHE_ENTRIES)
+def as_arrow_str(col):
+    return col.astype("string[pyarrow]")
 
 # load default or uploaded data
 st.sidebar.title("📂 Upload Your Data")
-uploaded_file = st.sidebar.file_uploader("Upload CSV", type=["csv"])
+uploaded_file = st.sidebar.file_uploader("Upload CSV or Parquet", type=["csv", "parquet"])
 if uploaded_file is not None:
-    df = load_data(uploaded_file)
+    fmt = "parquet" if uploaded_file.name.lower().endswith(".parquet") else "csv"
+    df = load_data(uploaded_file.getvalue(), fmt)
+    data_key = uploaded_file.file_id
 else:
-    df = load_data("clean_data.csv")
+    df = load_data("clean_data.parquet", "parquet")
+    data_key = "clean_data.parquet"
+df = prepare(df)
+ages = df["age"].to_numpy()
+responded_mask = df["Campaign_Accepted_Count"].to_numpy() > 0
 
-# --- columns lists ---
-product_cols = ["MntWines", "MntFruits", "MntMeatProducts", "MntFishProducts", "MntSweetProducts", "MntGoldProds"]
-purchase_channels = ["NumWebPurchases", "NumCatalogPurchases", "NumStorePurchases"]
-cmp_cols = ['AcceptedCmp1','AcceptedCmp2','AcceptedCmp3','AcceptedCmp4','AcceptedCmp5']
+# column totals with an ordered categorical index, so bar charts keep this order as-is
+def category_totals(block, sort=True):
+    totals = block.sum()
+    if sort:
+        totals = totals.sort_values(ascending=False)
+    totals.index = pd.CategoricalIndex(totals.index, categories=totals.index, ordered=True)
+    return totals
 
-# --- feature engineering ---
-df["Join_Year"] = pd.to_datetime(df["Dt_Customer"]).dt.year
-df["Join_Month"] = pd.to_datetime(df["Dt_Customer"]).dt.month
-df["Total_Spend"] = df[product_cols].sum(axis=1)
-df["Campaign_Accepted_Count"] = df[cmp_cols].sum(axis=1)
+# bar of category_totals; the x axis is categorical in the index order,
+# so plotly neither re-infers its type nor re-sorts it
+def totals_bar(totals, **kwargs):
+    fig = px.bar(x=totals.index, y=totals.values, color_discrete_sequence=["#00B4D8"], **kwargs)
+    fig.update_xaxes(type="category", categoryorder="array", categoryarray=list(totals.index.categories))
+    return fig
+
+# --- cached aggregates ---
+# keyed on the dataset and scalar filter bounds only; all close over the loaded df.
+# slider bounds have many distinct values and the cache is shared across sessions, so cap it
+BOUNDS_CACHE_ENTRIES = 128
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def customer_aggregates(data_key, age_lo, age_hi):
+    idx = (ages >= age_lo) & (ages <= age_hi)
+    return {
+        "n": int(np.count_nonzero(idx)),
+        "avg_income": np.nanmean(df["Income"].to_numpy()[idx], dtype=np.float64),
+        "response_rate": responded_mask[idx].mean(),
+        "accepted_total": int(df["Campaign_Accepted_Count"].to_numpy()[idx].sum()),
+        "responded": int(np.count_nonzero(responded_mask[idx])),
+        "channel_totals": category_totals(df.loc[idx, purchase_channels]),
+    }
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def spend_aggregates(data_key, income_lo, income_hi):
+    income = df["Income"].to_numpy()
+    idx = (income >= income_lo) & (income <= income_hi)
+    sub = df.loc[idx, product_cols + ["_YM", "Total_Spend"]]
+    time_df = sub.groupby("_YM", sort=True)["Total_Spend"].sum().rename_axis("Join_Date").reset_index()
+    time_df["Join_Date"] = time_df["Join_Date"].dt.to_timestamp()
+    return (category_totals(sub[product_cols]), time_df,
+            sub["Total_Spend"].sum(), sub["Total_Spend"].mean())
+
+# whole-dataset reductions shared by the campaigns and chatbot tabs
+@st.cache_data(show_spinner=False, max_entries=DATA_CACHE_ENTRIES)
+def session_stats(data_key):
+    return {
+        "cmp_totals": category_totals(df[cmp_cols], sort=False),
+        "prod_totals": category_totals(df[product_cols]),
+        "prod_mean": df[product_cols].mean(),
+        "channel_totals": category_totals(df[purchase_channels]),
+        "total_spend": int(df["Total_Spend"].sum()),
+        "avg_spend": int(df["Total_Spend"].mean()),
+        "avg_income": int(np.nanmean(df["Income"].to_numpy(), dtype=np.float64)),
+        "web_visits_avg": df["NumWebVisitsMonth"].mean(),
+        "response_rate": df["Response"].mean(),
+        "multi_campaign": int((df["Campaign_Accepted_Count"] > 1).sum()),
+        # integer ages are small and non-negative, so a bincount gives the mode in one pass
+        "age_mode": (int(np.bincount(ages).argmax())
+                     if np.issubdtype(ages.dtype, np.integer) and ages.min() >= 0
+                     else df["age"].mode()[0]),
+        "n": len(df),
+    }
+
+# every chatbot answer, built once per dataset and day; strings go to st.success, tables to st.write
+@st.cache_data(show_spinner=False, max_entries=DATA_CACHE_ENTRIES)
+def compute_answers(data_key, today):
+    stats = session_stats(data_key)
+    days = (today - df["_Dt"]).dt.days.to_numpy()
+    return {
+        "What is the most common age among customers?": f"The most common age is: {stats['age_mode']}",
+        "How many total customers are in the dataset?": f"Total number of customers: {stats['n']}",
+        "What is the average customer income?": f"The average income is: ${stats['avg_income']:,}",
+        "What is the total and average spend per customer?":
+            f"Total Spend: ${stats['total_spend']:,}, Average Spend per Customer: ${stats['avg_spend']:,}",
+        "Which product category has the highest average spend?":
+            f"The product category with the highest average spend is: {stats['prod_mean'].idxmax()}",
+        "How much is spent on each product type?": stats["prod_totals"],
+        "Which purchase channel is most preferred?":
+            f"The most preferred purchase channel is: {stats['channel_totals'].index[0]}",
+        "How many purchases occurred through each channel?": stats["channel_totals"],
+        "What is the average number of website visits per month?":
+            f"Average Website Visits per Month: {stats['web_visits_avg']:.2f}",
+        "What is the overall response rate to campaigns?": f"Response Rate: {stats['response_rate']*100:.2f}%",
+        "How many customers accepted more than one campaign?":
+            f"Customers who accepted more than one campaign: {stats['multi_campaign']}",
+        "How many responses were there for each campaign?": stats["cmp_totals"].sort_values(ascending=False),
+        "How many customers are old vs new based on 1000 days?":
+            f"Old Customers (>1000 days): {int((days > 1000).sum())}, "
+            f"New Customers (<=1000 days): {int((days <= 1000).sum())}",
+    }
+
+# deterministic, stratified subset of the filtered rows for plotting; kpis stay on the full data.
+# only the requested cols are copied out of df
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def plot_sample(data_key, column, lo, hi, strata, cols, n=5000):
+    values = df[column].to_numpy()
+    idx = (values >= lo) & (values <= hi)
+    cols = list(cols)
+    sub = df.loc[idx, list(dict.fromkeys(cols + [strata]))]
+    if len(sub) <= n:
+        return sub[cols]
+    # shuffle once, then keep each stratum's share of n but never fewer than one row
+    shuffled = sub.sample(frac=1, random_state=0)
+    groups = shuffled.groupby(strata, observed=True)[strata]
+    quota = np.maximum(1, np.round(groups.transform("size").to_numpy() * n / len(sub)))
+    keep = groups.cumcount().to_numpy() < quota
+    return shuffled.loc[keep, cols].sort_index()
+
+# --- cached figures ---
+# styled figures keyed on the same filter bounds as the aggregates they draw
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_income_hist(data_key, age_lo, age_hi):
+    sample = plot_sample(data_key, "age", age_lo, age_hi, strata="age", cols=["Income"])
+    return style_plot(px.histogram(sample, x="Income", nbins=30, color_discrete_sequence=["#00B4D8"]))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_age_spend_box(data_key, age_lo, age_hi):
+    sample = plot_sample(data_key, "age", age_lo, age_hi, strata="age", cols=["age", "Total_Spend"])
+    return style_plot(webgl_box(sample, x="age", y="Total_Spend"))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_income_campaign_box(data_key, age_lo, age_hi):
+    sample = plot_sample(data_key, "age", age_lo, age_hi, strata="age", cols=["Campaign_Accepted_Count", "Income"])
+    return style_plot(webgl_box(sample,
+                                x="Campaign_Accepted_Count",
+                                y="Income"))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_channel_bar(data_key, age_lo, age_hi):
+    channel_totals = customer_aggregates(data_key, age_lo, age_hi)["channel_totals"]
+    return style_plot(totals_bar(channel_totals, text=channel_totals.values,
+                                 labels={"x": "Channel", "y": "Total Purchases"}))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_channel_response_box(data_key, age_lo, age_hi):
+    sample = plot_sample(data_key, "age", age_lo, age_hi, strata="age",
+                         cols=purchase_channels + ["Campaign_Accepted_Count"])
+    response_df = pd.DataFrame({
+        "Total_Channel_Purchases": sample[purchase_channels].sum(axis=1),
+        "Responded": pd.Categorical.from_codes((sample["Campaign_Accepted_Count"].to_numpy() > 0).astype(np.int8),
+                                               categories=["No", "Yes"]),
+    })
+    fig = px.box(response_df, x="Responded", y="Total_Channel_Purchases", color="Responded",
+                 color_discrete_sequence=["#00B4D8", "#90E0EF"])
+    return style_plot(fig)
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_product_bar(data_key, income_lo, income_hi):
+    return style_plot(totals_bar(spend_aggregates(data_key, income_lo, income_hi)[0]))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_spend_line(data_key, income_lo, income_hi):
+    time_df = spend_aggregates(data_key, income_lo, income_hi)[1]
+    return style_plot(px.line(time_df, x="Join_Date", y="Total_Spend", markers=True))
+
+@st.cache_data(show_spinner=False, max_entries=BOUNDS_CACHE_ENTRIES)
+def build_marital_box(data_key, income_lo, income_hi):
+    sample = plot_sample(data_key, "Income", income_lo, income_hi, strata="Marital_Status",
+                         cols=["Marital_Status", "Total_Spend"])
+    fig = px.box(sample, x="Marital_Status", y="Total_Spend", color="Marital_Status",
+                 color_discrete_sequence=px.colors.qualitative.Set2)
+    return style_plot(fig)
+
+@st.cache_data(show_spinner=False, max_entries=DATA_CACHE_ENTRIES)
+def build_campaign_bar(data_key):
+    return style_plot(totals_bar(session_stats(data_key)["cmp_totals"]))
 
 # --- tabs layout ---
+# tabs with their own widgets are fragments so those widgets only rerun their tab;
+# the age slider stays in the full run because the campaigns tab reads it too
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["Dataset", "Customer", "Spending", "Campaigns", "Chatbot"])
 
 # 📁 Dataset Tab
-with tab1:
+@st.fragment
+def dataset_tab():
     st.title("📁 Dataset Preview")
-    column = st.selectbox("Select Column", df.columns)
+    # underscore columns are internal helpers, not part of the dataset
+    visible_cols = [c for c in df.columns if not c.startswith("_")]
+    column = st.selectbox("Select Column", visible_cols)
     value = st.text_input("Search")
     if value:
-        result = df[df[column].astype(str).str.contains(value)]
-        st.write(f"Found {result.shape[0]} rows")
-        st.dataframe(result)
+        mask = as_arrow_str(df[column]).str.contains(value, regex=False, case=False, na=False)
+        st.write(f"Found {int(mask.sum())} rows")
+        st.dataframe(df.loc[mask, visible_cols])
     else:
-        st.dataframe(df.head())
+        st.dataframe(df[visible_cols].head())
+
+with tab1:
+    dataset_tab()
 
 #Customer Tab
 with tab2:
     st.header("Customer Overview")
     min_age, max_age = int(df["age"].min()), int(df["age"].max())
     age_range = st.slider("Select Age Range", min_value=min_age, max_value=max_age, value=(min_age, max_age))
-    filtered_df = df[(df["age"] >= age_range[0]) & (df["age"] <= age_range[1])]
+    customer_stats = customer_aggregates(data_key, *age_range)
     display_kpi([
-        ("Total Customers", len(filtered_df)),
-        ("Average Income", f"${int(filtered_df['Income'].mean()):,}"),
-        ("Campaign Response Rate", f"{round((filtered_df['Campaign_Accepted_Count'] > 0).mean() * 100, 2)}%")
+        ("Total Customers", customer_stats["n"]),
+        ("Average Income", f"${int(customer_stats['avg_income']):,}"),
+        ("Campaign Response Rate", f"{round(customer_stats['response_rate'] * 100, 2)}%")
     ])
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        fig = px.histogram(filtered_df, x="Income", nbins=30, color_discrete_sequence=["#00B4D8"])
         st.subheader("💰 Income Distribution")
-        st.plotly_chart(style_plot(fig), use_container_width=True, key="income_dist")
+        st.plotly_chart(build_income_hist(data_key, *age_range), use_container_width=True, key="income_dist")
 
     with col2:
-        fig = px.box(filtered_df, x="age", y="Total_Spend", points="all", color_discrete_sequence=["#00B4D8"])
         st.subheader("🎯 Age vs Total Spend")
-        st.plotly_chart(style_plot(fig), use_container_width=True, key="age_vs_spend")
+        st.plotly_chart(build_age_spend_box(data_key, *age_range), use_container_width=True, key="age_vs_spend")
 
     with col3:
         st.subheader("📈 Income vs Campaign Response")
-        fig = px.box(filtered_df,
-                     x="Campaign_Accepted_Count",
-                     y="Income",
-                     points="all",
-                     color_discrete_sequence=["#00B4D8"])
-        st.plotly_chart(style_plot(fig), use_container_width=True, key="income_vs_campaign")
+        st.plotly_chart(build_income_campaign_box(data_key, *age_range), use_container_width=True,
+                        key="income_vs_campaign")
 
 #Spending Tab
-with tab3:
+@st.fragment
+def spending_tab():
     st.header("Spending Overview")
     income_range = st.slider("Filter by Income", int(df["Income"].min()), int(df["Income"].max()), (20000, 60000))
     selected_product = st.selectbox("Select Product Type", product_cols)
-    spend_df = df[(df["Income"] >= income_range[0]) & (df["Income"] <= income_range[1])].copy()
-    spend_df["Selected_Product_Spend"] = spend_df[selected_product]
+
+    _, _, total_spend, avg_spend = spend_aggregates(data_key, *income_range)
 
     display_kpi([
-        ("Total Spend", f"${int(spend_df['Total_Spend'].sum()):,}"),
-        ("Avg Spend per Customer", f"${int(spend_df['Total_Spend'].mean()):,}"),
+        ("Total Spend", f"${int(total_spend):,}"),
+        ("Avg Spend per Customer", f"${int(avg_spend):,}"),
     ])
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("🛒 Spend per Product Category")
-        totals = spend_df[product_cols].sum().sort_values(ascending=False)
-        fig = px.bar(x=totals.index, y=totals.values, color_discrete_sequence=["#00B4D8"])
-        st.plotly_chart(style_plot(fig), use_container_width=True, key="spend_product")
+        st.plotly_chart(build_product_bar(data_key, *income_range), use_container_width=True, key="spend_product")
 
     with col2:
         st.subheader("📈 Spend Over Time")
-        time_df = spend_df.groupby(["Join_Year", "Join_Month"])["Total_Spend"].sum().reset_index()
-        time_df["Join_Date"] = pd.to_datetime(time_df["Join_Year"].astype(str) + "-" + time_df["Join_Month"].astype(str))
-        fig = px.line(time_df, x="Join_Date", y="Total_Spend", markers=True)
-        st.plotly_chart(style_plot(fig), use_container_width=True, key="spend_over_time")
+        st.plotly_chart(build_spend_line(data_key, *income_range), use_container_width=True, key="spend_over_time")
 
     st.subheader("Spending by Marital Status")
-    fig = px.box(spend_df, x="Marital_Status", y="Total_Spend", color="Marital_Status",
-                 color_discrete_sequence=px.colors.qualitative.Set2)
-    st.plotly_chart(style_plot(fig), use_container_width=True, key="spend_marital_status")
+    st.plotly_chart(build_marital_box(data_key, *income_range), use_container_width=True, key="spend_marital_status")
+
+with tab3:
+    spending_tab()
 
 #Campaigns Tab
 with tab4:
     display_kpi([
-        ("Accepted Campaigns", f"{int(filtered_df[cmp_cols].sum().sum())}"),
-        ("Responded Customers", f"{filtered_df[filtered_df['Campaign_Accepted_Count'] > 0].shape[0]}"),
+        ("Accepted Campaigns", f"{customer_stats['accepted_total']}"),
+        ("Responded Customers", f"{customer_stats['responded']}"),
     ])
 
     st.subheader("📊 Campaign Acceptance Distribution")
-    totals = df[cmp_cols].sum()
-    fig = px.bar(x=totals.index, y=totals.values, color_discrete_sequence=["#00B4D8"])
-    st.plotly_chart(style_plot(fig), use_container_width=True, key="campaign_acceptance")
+    st.plotly_chart(build_campaign_bar(data_key), use_container_width=True, key="campaign_acceptance")
 
     st.subheader("🛍️ Top Purchase Channels")
-    channel_totals = filtered_df[purchase_channels].sum().sort_values(ascending=False)
-    fig = px.bar(x=channel_totals.index, y=channel_totals.values, text=channel_totals.values,
-                 labels={"x": "Channel", "y": "Total Purchases"}, color_discrete_sequence=["#00B4D8"])
-    st.plotly_chart(style_plot(fig), use_container_width=True, key="top_channels")
+    st.plotly_chart(build_channel_bar(data_key, *age_range), use_container_width=True, key="top_channels")
 
     st.subheader("📦 Channel Purchases vs Campaign Response")
-    filtered_df["Total_Channel_Purchases"] = filtered_df[purchase_channels].sum(axis=1)
-    filtered_df["Responded"] = filtered_df["Campaign_Accepted_Count"].apply(lambda x: "Yes" if x > 0 else "No")
-    fig = px.box(filtered_df, x="Responded", y="Total_Channel_Purchases", color="Responded",
-                 color_discrete_sequence=["#00B4D8", "#90E0EF"])
-    st.plotly_chart(style_plot(fig), use_container_width=True, key="channel_vs_response")
+    st.plotly_chart(build_channel_response_box(data_key, *age_range), use_container_width=True,
+                    key="channel_vs_response")
 
 #Chatbot Tab
-with tab5:
+@st.fragment
+def chatbot_tab():
     st.header("🤖 Chatbot")
     st.markdown("Ask a question about the dataset:")
 
-    question = st.selectbox("Choose a question:", [
-        "What is the most common age among customers?",
-        "How many total customers are in the dataset?",
-        "What is the average customer income?",
-        "What is the total and average spend per customer?",
-        "Which product category has the highest average spend?",
-        "How much is spent on each product type?",
-        "Which purchase channel is most preferred?",
-        "How many purchases occurred through each channel?",
-        "What is the average number of website visits per month?",
-        "What is the overall response rate to campaigns?",
-        "How many customers accepted more than one campaign?",
-        "How many responses were there for each campaign?",
-        "How many customers are old vs new based on 1000 days?"
-    ])
+    answers = compute_answers(data_key, pd.Timestamp.today().normalize())
+    question = st.selectbox("Choose a question:", list(answers))
 
     if st.button("💬 Get Answer"):
-        if question == "What is the most common age among customers?":
-            st.success(f"The most common age is: {df['age'].mode()[0]}")
-        elif question == "How many total customers are in the dataset?":
-            st.success(f"Total number of customers: {df.shape[0]}")
-        elif question == "What is the average customer income?":
-            st.success(f"The average income is: ${int(df['Income'].mean()):,}")
-        elif question == "What is the total and average spend per customer?":
-            st.success(f"Total Spend: ${int(df['Total_Spend'].sum()):,}, Average Spend per Customer: ${int(df['Total_Spend'].mean()):,}")
-        elif question == "Which product category has the highest average spend?":
-            top_product = df[product_cols].mean().idxmax()
-            st.success(f"The product category with the highest average spend is: {top_product}")
-        elif question == "How much is spent on each product type?":
-            st.write(df[product_cols].sum().sort_values(ascending=False))
-        elif question == "Which purchase channel is most preferred?":
-            top_channel = df[purchase_channels].mean().idxmax()
-            st.success(f"The most preferred purchase channel is: {top_channel}")
-        elif question == "How many purchases occurred through each channel?":
-            st.write(df[purchase_channels].sum().sort_values(ascending=False))
-        elif question == "What is the average number of website visits per month?":
-            st.success(f"Average Website Visits per Month: {df['NumWebVisitsMonth'].mean():.2f}")
-        elif question == "What is the overall response rate to campaigns?":
-            st.success(f"Response Rate: {df['Response'].mean()*100:.2f}%")
-        elif question == "How many customers accepted more than one campaign?":
-            st.success(f"Customers who accepted more than one campaign: {(df['Campaign_Accepted_Count'] > 1).sum()}")
-        elif question == "How many responses were there for each campaign?":
-            st.write(df[cmp_cols].sum().sort_values(ascending=False))
-        elif question == "How many customers are old vs new based on 1000 days?":
-            df['Customer_Since_Days'] = (pd.to_datetime("today") - pd.to_datetime(df["Dt_Customer"])).dt.days
-            old_customers = (df['Customer_Since_Days'] > 1000).sum()
-            new_customers = (df['Customer_Since_Days'] <= 1000).sum()
-            st.success(f"Old Customers (>1000 days): {old_customers}, New Customers (<=1000 days): {new_customers}")
+        answer = answers[question]
+        if isinstance(answer, str):
+            st.success(answer)
+        else:
+            st.write(answer)
+
+with tab5:
+    chatbot_tab()
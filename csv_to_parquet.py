@@ -0,0 +1,4 @@
+# one-time conversion of the bundled csv to parquet, which the app loads by default
+import pandas as pd
+
+pd.read_csv("clean_data.csv").to_parquet("clean_data.parquet", index=False)